@@ -14,4 +14,6 @@ from .common import (
     NewsPostman,
     NewsPostmanJSON,
     NewsPostmanXML,
+    compile_selector,
+    css_select,
 )
@@ -8,6 +8,7 @@ class for JSON and XML format data. Maybe have more subclasses for other
 situations.
 """
 
+import functools
 import hashlib
 import json
 import math
@@ -19,6 +20,8 @@ import warnings
 from time import sleep
 
 import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
 import sqlalchemy
 from sqlalchemy import text
 from bs4 import BeautifulSoup
@@ -53,6 +56,29 @@ from ..constant import (
     MAX_MEDIA_PER_MEDIAGROUP,
 )
 
+# Keep-alive session shared by every postman: list pages, article pages and
+# Telegram posts reuse pooled connections instead of a new TCP/TLS handshake
+# per request.
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+@functools.lru_cache(maxsize=256)
+def compile_selector(selector):
+    """
+    Compile a CSS selector once.
+
+    Extractors sharing the same selector string share one compiled pattern,
+    so the CSS is not parsed again for every page and list item.
+    """
+    return soupsieve.compile(selector)
+
+
+def css_select(tag, selector):
+    """Same as tag.select(selector), with the compiled selector cached."""
+    return compile_selector(selector).select(tag)
+
 
 class InfoExtractor(object):
     """
@@ -79,6 +105,8 @@ class InfoExtractor(object):
         _outer_paragraph_selector
         _outer_time_selector
         _outer_source_selector
+        _parsed_text
+        _parsed_soup
     """
 
     _listURLs = []
@@ -111,11 +139,28 @@ class InfoExtractor(object):
     _outer_video_selector = None
     _keep_media_link = True
 
+    # Last parsed page, shared by the get_*_policy calls for the same text
+    _parsed_text = None
+    _parsed_soup = None
+
     def __init__(self, lang=''):
         """Construct the class."""
         self._DEBUG = True
         self._lang = lang
 
+    def _parse(self, text):
+        """
+        Parse a full page once.
+
+        NewsPostman passes the same text to every get_*_policy of an item, so
+        the title, paragraphs, time, source, image and video lookups reuse one
+        tree instead of parsing the page up to six times.
+        """
+        if text is not self._parsed_text:
+            self._parsed_soup = BeautifulSoup(text, 'lxml')
+            self._parsed_text = text
+        return self._parsed_soup
+
     def set_list_selector(self, selector):
         self._list_selector = selector
 
@@ -199,13 +244,13 @@ class InfoExtractor(object):
         :return: item dict list.
         """
         soup = BeautifulSoup(text, 'lxml')
-        data = soup.select(self._list_selector)
+        data = css_select(soup, self._list_selector)
         # print(data)
 
         news_list = []
         for i in data:
             soup2 = BeautifulSoup(str(i), 'lxml')
-            link_select = soup2.select(self._outer_link_selector)
+            link_select = css_select(soup2, self._outer_link_selector)
             link = get_full_link(link_select[0].get('href'), listURL)
             item = {
                 "title": link_select[0].get_text().strip(),
@@ -215,7 +260,7 @@ class InfoExtractor(object):
 
             if self._outer_title_selector:
                 try:
-                    item['title'] = soup2.select(self._outer_title_selector)[0].get_text().strip()
+                    item['title'] = css_select(soup2, self._outer_title_selector)[0].get_text().strip()
                 except IndexError:
                     item['title'] = ''
             else:
@@ -225,7 +270,7 @@ class InfoExtractor(object):
                 try:
                     paragraphs = [
                         keep_link(str(x), listURL)
-                        for x in soup2.select(self._outer_paragraph_selector)
+                        for x in css_select(soup2, self._outer_paragraph_selector)
                         if x.get_text().strip()
                     ]
                     item['paragraphs'] = '\n\n'.join(paragraphs) + '\n\n'
@@ -236,7 +281,7 @@ class InfoExtractor(object):
 
             if self._outer_time_selector:
                 try:
-                    item['time'] = soup2.select(self._outer_time_selector)[0].get_text().strip()
+                    item['time'] = css_select(soup2, self._outer_time_selector)[0].get_text().strip()
                 except IndexError:
                     item['time'] = ''
             else:
@@ -244,7 +289,7 @@ class InfoExtractor(object):
 
             if self._outer_source_selector:
                 try:
-                    item['source'] = keep_link(soup2.select(self._outer_source_selector)[0].get_text().strip(), listURL)
+                    item['source'] = keep_link(css_select(soup2, self._outer_source_selector)[0].get_text().strip(), listURL)
                 except IndexError:
                     item['source'] = ''
             else:
@@ -252,7 +297,7 @@ class InfoExtractor(object):
 
             if self._outer_image_selector:
                 try:
-                    tags_select = soup2.select(self._outer_image_selector)
+                    tags_select = css_select(soup2, self._outer_image_selector)
                     item['images'] = get_image_from_select(tags_select, listURL)
                 except IndexError:
                     item['images'] = []
@@ -261,7 +306,7 @@ class InfoExtractor(object):
 
             if self._outer_video_selector:
                 try:
-                    tags_select = soup2.select(self._outer_video_selector)
+                    tags_select = css_select(soup2, self._outer_video_selector)
                     item['videos'] = get_video_from_select(tags_select, listURL)
                 except IndexError:
                     item['videos'] = []
@@ -284,8 +329,8 @@ class InfoExtractor(object):
                 return keep_link(item['title'].replace('&nbsp;', ' '), item['link'])
         if not self._title_selector:
             return ''
-        soup = BeautifulSoup(text, 'lxml')
-        title_select = soup.select(self._title_selector)
+        soup = self._parse(text)
+        title_select = css_select(soup, self._title_selector)
         try:
             return title_select[0].getText().strip()
         except IndexError:  # Do not have this element because of missing/403/others
@@ -305,8 +350,8 @@ class InfoExtractor(object):
         if not self._paragraph_selector:
             return None
 
-        soup = BeautifulSoup(text, 'lxml')
-        paragraph_select = soup.select(self._paragraph_selector)
+        soup = self._parse(text)
+        paragraph_select = css_select(soup, self._paragraph_selector)
         # print(paragraph_select)
 
         url = item['link']
@@ -350,8 +395,8 @@ class InfoExtractor(object):
             return item['time']
         if not self._time_selector:
             return ''
-        soup = BeautifulSoup(text, 'lxml')
-        time_select = soup.select(self._time_selector)
+        soup = self._parse(text)
+        time_select = css_select(soup, self._time_selector)
         if not time_select:
             return ""
         publish_time = time_select[0].getText().strip().replace('\n', ' ')
@@ -369,8 +414,8 @@ class InfoExtractor(object):
             return item['source']
         if not self._source_selector:
             return ''
-        soup = BeautifulSoup(text, 'lxml')
-        source_select = soup.select(self._source_selector)
+        soup = self._parse(text)
+        source_select = css_select(soup, self._source_selector)
         url = item['link']
         try:
             # Maybe source is a link
@@ -391,8 +436,8 @@ class InfoExtractor(object):
             return item['images']
         if not self._image_selector:
             return []
-        soup = BeautifulSoup(text, 'lxml')
-        tags_select = soup.select(self._image_selector)
+        soup = self._parse(text)
+        tags_select = css_select(soup, self._image_selector)
         return get_image_from_select(tags_select, item['link'])
 
     def get_video_policy(self, text, item):
@@ -407,8 +452,8 @@ class InfoExtractor(object):
             return item['videos']
         if not self._video_selector:
             return []
-        soup = BeautifulSoup(text, 'lxml')
-        tags_select = soup.select(self._video_selector)
+        soup = self._parse(text)
+        tags_select = css_select(soup, self._video_selector)
         return get_video_from_select(tags_select, item['link'])
 
 
@@ -785,9 +830,13 @@ class NewsPostman(object):
         else:
             return pure_url
 
-    def _get_list(self, list_request_url):  # -> (list, int)
-        timeout = self._list_request_timeout
-        res = requests.get(list_request_url, headers=self._headers, timeout=timeout)
+    def fetch_list(self, list_request_url):
+        """Request a list page only, so callers can fetch many lists concurrently."""
+        return _session.get(list_request_url, headers=self._headers, timeout=self._list_request_timeout)
+
+    def _get_list(self, list_request_url, res=None):  # -> (list, int)
+        if res is None:
+            res = self.fetch_list(list_request_url)
         # print(res.text)
         if res.status_code == 200:
             res.encoding = self._list_request_response_encode
@@ -803,7 +852,7 @@ class NewsPostman(object):
         text = ""
         if url:
             timeout = self._full_request_timeout
-            res = requests.get(url, headers=self._headers, timeout=timeout)
+            res = _session.get(url, headers=self._headers, timeout=timeout)
             res.encoding = self._full_request_response_encode
             text = res.text
         text = self._extractor.full_pre_process(text, item['link'])
@@ -1025,7 +1074,7 @@ class NewsPostman(object):
     @limits(calls=1, period=1)
     def _real_post(self, token, method, data):
         # https://core.telegram.org/bots/api#sendmessage
-        res = requests.post('https://api.telegram.org/bot' + token + '/' + method, data, files=data['files'], proxies=self._proxies)
+        res = _session.post('https://api.telegram.org/bot' + token + '/' + method, data, files=data['files'], proxies=self._proxies)
         return res
 
     def _post(self, item, news_id):
@@ -1111,13 +1160,20 @@ class NewsPostman(object):
                 pass
             return False
 
-    def _action(self, no_post=False):  # -> (list, int)
+    def _action(self, no_post=False, prefetched=None):  # -> (list, int)
+        """
+        Fetch the lists and post new items.
+
+        :param prefetched: optional dict of list request url -> response already
+            downloaded by the caller (e.g. in parallel with other postmen).
+        """
+        prefetched = prefetched or {}
         duplicate_list = []
         total = 0
         for link in self._listURLs:
             list_request_url = self._get_request_url(link)
             # print(list_request_url)
-            l, num = self._get_list(list_request_url)
+            l, num = self._get_list(list_request_url, res=prefetched.get(list_request_url))
             total += num
             if l:
                 duplicate_list += l
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# admin_bot.py is a top-level script, not part of the telegram_news package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
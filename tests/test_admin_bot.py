@@ -0,0 +1,114 @@
+import types
+from datetime import datetime
+
+import pytest
+
+for _module in ("sqlalchemy", "requests", "bs4", "lxml", "soupsieve", "xmltodict"):
+    pytest.importorskip(_module)
+
+from sqlalchemy import create_engine, func  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import admin_bot  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bot.db'}")
+    admin_bot.Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _analytics_row(message_id, views):
+    row = dict.fromkeys(admin_bot.AnalyticsBuffer.FIELDS)
+    row.update(message_id=message_id, source="src", title="t", link="l", theme="news",
+               views=views, forwards=0, reactions=0)
+    return row
+
+
+def test_analytics_upsert_is_idempotent_on_message_id(db):
+    assert admin_bot.flush_analytics(db, [_analytics_row(42, 10)]) == 1
+    assert admin_bot.flush_analytics(db, [_analytics_row(42, 25)]) == 1
+
+    PostAnalytics = admin_bot.PostAnalytics
+    assert db.query(func.count(PostAnalytics.id)).scalar() == 1
+    row = db.query(PostAnalytics).one()
+    assert row.views == 25
+    assert row.posted_at is not None
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = "" if status_code == 200 else '{"ok":false}'
+        self.content = self.text.encode()
+
+
+class _FakeAPI:
+    def __init__(self, failing_chat):
+        self.failing_chat = failing_chat
+        self.sent = []
+
+    def send_message(self, chat_id, text, **kwargs):
+        self.sent.append(chat_id)
+        return _Response(403 if chat_id == self.failing_chat else 200)
+
+
+def _event(n):
+    return types.SimpleNamespace(
+        category="conference", date_event=datetime(2030, 1, 1, 12, 0), title=f"Event {n}",
+        location=None, coin=None, description=None, importance=5, source_url=None,
+    )
+
+
+def test_dispatch_alerts_is_not_held_back_by_a_failing_chat(monkeypatch):
+    monkeypatch.setattr(admin_bot, "ALERT_CHAT_INTERVAL", 0)
+    api = _FakeAPI(failing_chat="dead")
+    events = [_event(1), _event(2)]
+
+    done = admin_bot._dispatch_alerts(api, ["good", "dead"], events, "1day")
+
+    assert done == events
+    assert api.sent.count("good") == 2
+    assert api.sent.count("dead") == 2
+
+
+def test_dispatch_alerts_leaves_events_pending_after_stop(monkeypatch):
+    monkeypatch.setattr(admin_bot, "ALERT_CHAT_INTERVAL", 0)
+    api = _FakeAPI(failing_chat=None)
+    admin_bot.STOP.set()
+    try:
+        done = admin_bot._dispatch_alerts(api, ["good"], [_event(1)], "1day")
+    finally:
+        admin_bot.STOP.clear()
+
+    assert done == []
+    assert api.sent == []
+
+
+class _BrokenSession:
+    def __init__(self):
+        self.rolled_back = False
+
+    def query(self, *args):
+        raise OperationalError("SELECT", {}, Exception("database is down"))
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def test_config_manager_falls_back_to_defaults_on_db_error():
+    session = _BrokenSession()
+    config_mgr = admin_bot.ConfigManager(session)
+
+    config = config_mgr.get_config()
+
+    assert config == admin_bot.DEFAULT_CONFIG
+    assert config is not admin_bot.DEFAULT_CONFIG
+    assert session.rolled_back
+    # Defaults are not cached: the next call goes back to the database
+    assert config_mgr._cache is None